@@ -8,25 +8,43 @@ Single-file static site generator (no JS) supporting 4 modes:
   4) subdomain : each city is its own subdomain (links/canonicals become absolute)
 
 Usage:
-  python3 generate.py
+  python3 generate.py [regular|cost|state|subdomain|regular_city_only]
+  python3 generate.py all                    # every mode, into public/{mode}/
+  python3 generate.py cost --force           # full rebuild (ignore the incremental manifest)
   python3 -m http.server 8000 --directory public
 
 ENV (optional):
   SITE_ORIGIN="https://example.com"          # used for absolute canonicals
   SUBDOMAIN_BASE="example.com"               # used for subdomain links/canonicals
+  SITE_MODES="regular,cost"                  # modes built by `all` (default: every mode)
+  CSS_INLINE=1                               # inline the CSS instead of linking /styles.<hash>.css
+  PRECOMPRESS=1                              # also write .gz copies (for gzip_static-style hosts)
+  BUILD_WORKERS=4                            # render processes (default: every CPU; 1 = in-process)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 import csv
-import html
+import glob
+import gzip
+import hashlib
+import json
+import multiprocessing
 import os
 import sys
 import re
 import shutil
+import threading
+
+# directory holding generate.py (site assets, wrangler.jsonc)
+HERE: Path = Path(__file__).resolve().parent
 
 
 # ============================================================
@@ -92,8 +110,9 @@ US_STATE_NAMES: dict[str, str] = {
 # CONFIG
 # ============================================================
 
-@dataclass(frozen=True)
-class SiteConfig:
+class SiteConfig(NamedTuple):
+  """Static site settings + copy. Immutable; built once as CONFIG."""
+
   # Data
   cities_csv: Path = Path("cities.csv")
 
@@ -324,242 +343,15 @@ class SiteConfig:
   )
 
 
-COST_INNER = """
-<section>
-  <h2>Woodpecker Damage Repair Cost Ranges (Most Common Repairs)</h2>
-  <div class="table-scroll">
-    <table>
-      <thead>
-        <tr>
-          <th>Repair Scenario</th>
-          <th>Typical Cost Range</th>
-          <th>What You’re Paying For</th>
-        </tr>
-      </thead>
-      <tbody>
-        <tr>
-          <td>Small hole repair (up to ~2")</td>
-          <td>$150–$350</td>
-          <td>Clean-out, epoxy patch/plug, seal, spot finish</td>
-        </tr>
-        <tr>
-          <td>Medium hole repair (~2–6")</td>
-          <td>$300–$800</td>
-          <td>Deeper patch/plug, sealing, finish blending</td>
-        </tr>
-        <tr>
-          <td>Large hole repair (over ~6")</td>
-          <td>$600–$1,500</td>
-          <td>Section rebuild or partial replacement, sealing, finish</td>
-        </tr>
-        <tr>
-          <td>Replace a damaged siding board / small area</td>
-          <td>$500–$2,500</td>
-          <td>Remove/replace material, water management, finish match</td>
-        </tr>
-        <tr>
-          <td>Structural repair (sheathing/stud/insulation affected)</td>
-          <td>$1,000–$3,500+</td>
-          <td>Open-up, replace damaged wood, restore weather barrier</td>
-        </tr>
-        <tr>
-          <td>Interior wall repair (if penetrated)</td>
-          <td>$250–$900</td>
-          <td>Drywall patch, texture match, paint</td>
-        </tr>
-        <tr>
-          <td>Paint/stain blending (separate line item)</td>
-          <td>$150–$600</td>
-          <td>Prime + blend to hide repair</td>
-        </tr>
-        <tr>
-          <td>High access work (2nd story / steep roofline)</td>
-          <td>+15% to +50%</td>
-          <td>Setup time, safety, ladders or lift</td>
-        </tr>
-      </tbody>
-    </table>
-  </div>
-
-  <p>
-    <strong>Typical total:</strong> $300–$2,500.
-    <strong>When hidden damage is present:</strong> $5,000+ is possible.
-  </p>
-
-  <hr />
-
-  <h2>Cost by Severity (Fast Self-Assessment)</h2>
-
-  <h3>Minor</h3>
-  <ul>
-    <li><strong>What it looks like:</strong> 1–2 small holes, shallow pecks, solid wood</li>
-    <li><strong>Expected cost:</strong> $150–$500</li>
-    <li><strong>Common repair:</strong> epoxy patch/plug + seal + spot finish</li>
-  </ul>
-
-  <h3>Moderate</h3>
-  <ul>
-    <li><strong>What it looks like:</strong> multiple holes in one zone, repeated pecking on the same board</li>
-    <li><strong>Expected cost:</strong> $500–$2,500</li>
-    <li><strong>Common repair:</strong> multi-hole patching or board/panel replacement + finish blending</li>
-  </ul>
-
-  <h3>Severe</h3>
-  <ul>
-    <li><strong>What it looks like:</strong> cavity access, soft/rotted wood, water staining, nesting attempts</li>
-    <li><strong>Expected cost:</strong> $2,500–$5,000+</li>
-    <li><strong>Common repair:</strong> open-up + structural repair + insulation/water barrier restoration</li>
-  </ul>
-
-  <hr />
-
-  <h2>Repair Cost by Siding Material</h2>
-  
-  <div class="table-scroll">
-    <table>
-      <thead>
-        <tr>
-          <th>Siding Material</th>
-          <th>Typical Repair Range</th>
-          <th>Why It Costs More (or Less)</th>
-        </tr>
-      </thead>
-      <tbody>
-        <tr>
-          <td>Wood lap siding</td>
-          <td>$300–$3,000</td>
-          <td>Finish matching + moisture protection are labor-heavy</td>
-        </tr>
-        <tr>
-          <td>Cedar shake</td>
-          <td>$500–$4,000</td>
-          <td>Individual shake replacement + blend pattern/aging</td>
-        </tr>
-        <tr>
-          <td>Vinyl siding</td>
-          <td>$250–$2,000</td>
-          <td>Often panel replacement; color matching varies by age</td>
-        </tr>
-        <tr>
-          <td>Fiber cement</td>
-          <td>$500–$3,500</td>
-          <td>Cutting/fastening + repainting required</td>
-        </tr>
-        <tr>
-          <td>Stucco</td>
-          <td>$800–$4,500</td>
-          <td>Multi-step patch + texture matching</td>
-        </tr>
-      </tbody>
-    </table>
-  </div>
-
-  <hr />
-
-  <h2>What Increases Woodpecker Repair Costs</h2>
+@lru_cache(maxsize=1)
+def cost_inner() -> str:
+  # static cost-guide HTML (ranges table, insurance notes); only the cost pages use it
+  return (HERE / "assets" / "cost_inner.html").read_text(encoding="utf-8")
 
-  <ul>
-    <li><strong>Hidden moisture:</strong> swelling, rot, or stained sheathing behind siding</li>
-    <li><strong>Hole depth:</strong> penetration into cavity or insulation triggers bigger scope</li>
-    <li><strong>Repeat targeting:</strong> multiple boards or corners need repair + protection</li>
-    <li><strong>Access:</strong> second story, roofline, chimney, steep grade</li>
-    <li><strong>Finish matching:</strong> older paint/stain requires blending, not just patching</li>
-  </ul>
-
-  <hr />
-
-  <h2>When Patching Is Enough vs When Replacement Is Required</h2>
-
-  <h3>Patching is usually enough if:</h3>
-  <ul>
-    <li>The wood is hard when probed</li>
-    <li>Holes are shallow and limited to the surface</li>
-    <li>No water staining, softness, or swelling is present</li>
-  </ul>
-
-  <h3>Replacement is usually required if:</h3>
-  <ul>
-    <li>The wood feels soft or spongy</li>
-    <li>Holes are large, deep, or connected internally</li>
-    <li>There is rot, cracking, swelling, or delamination</li>
-    <li>The same board has been hit repeatedly</li>
-  </ul>
-
-  <p>
-    <strong>Rule:</strong> If a screwdriver sinks in easily, replacement is more reliable than patching.
-  </p>
-
-  <hr />
-
-  <h2>Prevention Costs (Avoid Paying Twice)</h2>
-
-  <p>
-    Repairs alone often get hit again. Physical exclusion is what consistently stops repeat damage.
-  </p>
-
-  <div class="table-scroll">
-    <table>
-      <thead>
-        <tr>
-          <th>Prevention Method</th>
-          <th>Typical Cost</th>
-          <th>Best Use</th>
-        </tr>
-      </thead>
-      <tbody>
-        <tr>
-          <td>Bird netting over the target area</td>
-          <td>$150–$800</td>
-          <td>Repeat pecking zones on siding walls</td>
-        </tr>
-        <tr>
-          <td>Hardware cloth / barrier panels</td>
-          <td>$150–$900</td>
-          <td>Corners, fascia, trim boards that get repeatedly hit</td>
-        </tr>
-        <tr>
-          <td>Metal flashing / corner protection</td>
-          <td>$200–$1,000</td>
-          <td>High-impact edges and roofline zones</td>
-        </tr>
-        <tr>
-          <td>Professional wildlife exclusion / control</td>
-          <td>$300–$1,500</td>
-          <td>Persistent activity or nesting attempts</td>
-        </tr>
-        <tr>
-          <td>Visual deterrents (tape/decoys)</td>
-          <td>$20–$150</td>
-          <td>Short-term support only (not a primary fix)</td>
-        </tr>
-      </tbody>
-    </table>
-  </div>
-
-  <hr />
-
-  <h2>What a Siding Repair Quote Should Include</h2>
-
-  <ul>
-    <li>Hole count and largest hole diameter</li>
-    <li>Patch vs board/panel replacement scope</li>
-    <li>Waterproofing plan (sealant, flashing, weather barrier restoration)</li>
-    <li>Finish plan (prime + paint blend or stain match)</li>
-    <li>Access plan (ladder vs lift and how it impacts price)</li>
-    <li>Prevention plan (netting/barriers) to reduce repeat damage</li>
-  </ul>
-
-  <hr />
-
-  <h2>Woodpecker Damage Insurance Coverage (Common Reality)</h2>
-
-  <p>
-    Home insurance may cover woodpecker damage depending on the policy and exclusions. Coverage is more likely when
-    damage is sudden and not tied to neglect. Document the damage immediately and ask whether animal-related exterior
-    damage is covered.
-  </p>
-</section>
-"""
+@lru_cache(maxsize=1)
+def cost_inner_b() -> bytes:
+  # encoded once; every city cost page splices these same bytes
+  return cost_inner().encode("utf-8")
 
 HOWTO_INNER = """
 <section>
@@ -697,61 +489,106 @@ HOWTO_INNER = """
 
 CONFIG = SiteConfig()
 
-CityWithCol = tuple[str, str, float]
+class CityWithCol(NamedTuple):
+  """One CSV row. Still unpacks as (city, st, col) like the old plain tuple."""
+  city: str
+  st: str
+  col: float
+
+# One state's cities as parallel columns (names, cols), sorted by name.
+StateCities = tuple[tuple[str, ...], tuple[float, ...]]
 
 
 # ============================================================
 # LOAD CITIES
 # ============================================================
 
-def load_cities_from_csv(path: Path) -> tuple[CityWithCol, ...]:
-  out: list[CityWithCol] = []
+def iter_cities_from_csv(path: Path) -> Iterator[CityWithCol]:
   with path.open(newline="", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
+    reader = csv.reader(f)
+    header = next(reader, None)
     required = {"city", "state", "col"}
-    if not reader.fieldnames or not required.issubset(reader.fieldnames):
-      raise ValueError(f"CSV must have headers: city,state,col (found: {reader.fieldnames})")
+    if not header or not required.issubset(header):
+      raise ValueError(f"CSV must have headers: city,state,col (found: {header})")
+    i_city, i_state, i_col = header.index("city"), header.index("state"), header.index("col")
+    width = max(i_city, i_state, i_col) + 1
 
-    for i, row in enumerate(reader, start=2):
-      city = (row.get("city") or "").strip()
-      state = (row.get("state") or "").strip().upper()
-      col_raw = (row.get("col") or "").strip()
+    for i, row in enumerate(filter(None, reader), start=2):  # blank lines skipped, like DictReader
+      if len(row) < width:
+        raise ValueError(f"Missing city/state/col at CSV line {i}: {row}")
+      city = row[i_city].strip()
+      state = sys.intern(row[i_state].strip().upper())  # one shared object per state
+      col_raw = row[i_col].strip()
       if not city or not state or not col_raw:
         raise ValueError(f"Missing city/state/col at CSV line {i}: {row}")
       try:
         col = float(col_raw)
       except ValueError as e:
         raise ValueError(f"Invalid col at CSV line {i}: {col_raw!r}") from e
-      out.append((city, state, col))
-  return tuple(out)
+      yield CityWithCol(city, state, col)
+
+def load_and_group(path: Path) -> tuple[tuple[CityWithCol, ...], dict[str, StateCities]]:
+  """
+  One pass over the CSV: returns the cities in file order plus the same rows
+  grouped by state as (names, cols) columns, each sorted by lowercased
+  city name. Every build reuses this grouping.
+  """
+  cities: list[CityWithCol] = []
+  groups: dict[str, list[CityWithCol]] = {}
+  for row in iter_cities_from_csv(path):
+    cities.append(row)
+    groups.setdefault(row.st, []).append(row)
+  by_state: dict[str, StateCities] = {}
+  for st, rows in groups.items():
+    rows.sort(key=lambda r: r.city.lower())
+    by_state[st] = (tuple(r.city for r in rows), tuple(r.col for r in rows))
+  return tuple(cities), by_state
 
 
-CITIES: tuple[CityWithCol, ...] = load_cities_from_csv(CONFIG.cities_csv)
+CITIES: tuple[CityWithCol, ...]
+CITIES_BY_STATE: dict[str, StateCities]
+CITIES, CITIES_BY_STATE = load_and_group(CONFIG.cities_csv)
 
 
 # ============================================================
 # HELPERS
 # ============================================================
 
+# Same mapping as html.escape(s, quote=True), applied in a single pass.
+_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+@lru_cache(maxsize=None)
 def esc(s: str) -> str:
-  return html.escape(s, quote=True)
+  return s.translate(_ESC_TABLE)
+
+class _SlugTable(dict):
+  """str.translate table: a-z/0-9 pass through, anything else becomes "-"."""
+  def __missing__(self, key: int) -> str:
+    return "-"
+
+_SLUG_TABLE = _SlugTable({ord(c): ord(c) for c in "abcdefghijklmnopqrstuvwxyz0123456789"})
 
+_CURLY = re.compile(r"\{([^}]+)\}")
+_ALT_EXT = re.compile(r"\.[a-z0-9]+$")
+_ALT_SEP = re.compile(r"[-_]+")
+_ALT_NUM = re.compile(r"\b\d+\b")
+_ALT_WS = re.compile(r"\s+")
+
+@lru_cache(maxsize=None)
 def slugify(s: str) -> str:
-  s = s.strip().lower()
-  s = re.sub(r"&", " and ", s)
-  s = re.sub(r"[^a-z0-9]+", "-", s)
-  s = re.sub(r"-{2,}", "-", s).strip("-")
-  return s
+  s = s.lower().replace("&", " and ").translate(_SLUG_TABLE)
+  # collapse dash runs and trim leading/trailing dashes
+  return "-".join(filter(None, s.split("-")))
 
 def filename_to_alt(filename: str) -> str:
     if not filename:
         return ""
 
     alt = filename.lower()
-    alt = re.sub(r"\.[a-z0-9]+$", "", alt)
-    alt = re.sub(r"[-_]+", " ", alt)
-    alt = re.sub(r"\b\d+\b", "", alt)
-    alt = re.sub(r"\s+", " ", alt).strip()
+    alt = _ALT_EXT.sub("", alt)
+    alt = _ALT_SEP.sub(" ", alt)
+    alt = _ALT_NUM.sub("", alt)
+    alt = _ALT_WS.sub(" ", alt).strip()
     return alt.capitalize()
 
 def clamp_title(title: str, max_chars: int = 70) -> str:
@@ -760,30 +597,123 @@ def clamp_title(title: str, max_chars: int = 70) -> str:
   return title[: max_chars - 1].rstrip() + "…"
 
 def state_full(abbr: str) -> str:
-  return US_STATE_NAMES.get(abbr.upper(), abbr.upper())
+  # abbr comes from the CSV loader, already stripped + uppercased
+  return US_STATE_NAMES.get(abbr, abbr)
+
+# Env override: PRECOMPRESS=1 also writes {file}.gz next to text outputs, for
+# servers that pick precompressed siblings (e.g. nginx `gzip_static on`).
+# Cloudflare Workers assets (wrangler.jsonc) does not, and compresses on its
+# own, so an .assetsignore keeps the .gz files out of that deploy.
+PRECOMPRESS = (os.environ.get("PRECOMPRESS") or "").strip() == "1"
+PRECOMPRESS_SUFFIXES = (".html", ".css", ".xml", ".txt")
+
+def write_bytes(path: str | Path, parts: list[bytes], *, make_dirs: bool = True) -> None:
+  path = os.fspath(path)
+  data = b"".join(parts)
+  if PRECOMPRESS and path.endswith(PRECOMPRESS_SUFFIXES):
+    digest = content_hash(data)
+    write_precompressed(path, data, digest, make_dirs=make_dirs)
+    changed = track_digest(path, digest)
+  else:
+    changed = track_output(path, data)
+  if not changed:
+    return  # unchanged since the last build
+  if make_dirs:
+    ensure_dir(os.path.dirname(path))
+  write_file(path, data)
+
+def write_precompressed(path: str, data: bytes, digest: str, *, make_dirs: bool) -> None:
+  # tracked under the plain bytes' digest: same input, same .gz (mtime=0)
+  gz_path = path + ".gz"
+  if not track_digest(gz_path, digest):
+    return
+  if make_dirs:
+    ensure_dir(os.path.dirname(path))
+  write_file(gz_path, gzip.compress(data, compresslevel=9, mtime=0))
+
+def write_file(path: str | Path, data: bytes) -> None:
+  # raw fd: one open/write/close, no buffered file object
+  fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+  try:
+    view = memoryview(data)
+    while view:
+      view = view[os.write(fd, view):]
+  finally:
+    os.close(fd)
+
+_made_dirs: set[str] = set()  # directories known to exist this build
+
+def ensure_dir(d: str) -> None:
+  if d not in _made_dirs:
+    os.makedirs(d, exist_ok=True)
+    while d and d not in _made_dirs:  # makedirs created the ancestors too
+      _made_dirs.add(d)
+      d = os.path.dirname(d)
+
+def create_parent_dirs(paths: Iterable[str]) -> None:
+  """
+  One makedirs per distinct parent (parents first), so the writes that
+  follow can skip their own mkdir.
+  """
+  for d in sorted({os.path.dirname(p) for p in paths}):
+    ensure_dir(d)
+
+def write_text(path: str | Path, content: str) -> None:
+  write_bytes(path, [content.encode("utf-8")])
 
-def write_text(path: Path, content: str) -> None:
-  path.parent.mkdir(parents=True, exist_ok=True)
-  path.write_text(content, encoding="utf-8")
+_reset_threads: list[threading.Thread] = []
 
 def reset_output_dir(p: Path) -> None:
+  """
+  Moves the old tree aside and deletes it on a background thread, so the
+  build can start writing right away. wait_for_resets() joins it.
+  """
+  _made_dirs.clear()
   if p.exists():
-    shutil.rmtree(p)
+    victim = p.with_name(f"{p.name}.old.{os.getpid()}")
+    try:
+      p.rename(victim)
+    except OSError:
+      shutil.rmtree(p)  # e.g. leftover victim dir; delete in place
+    else:
+      t = threading.Thread(target=shutil.rmtree, args=(victim,), kwargs={"ignore_errors": True})
+      t.start()
+      _reset_threads.append(t)
   p.mkdir(parents=True, exist_ok=True)
 
+def _rmtrees(paths: list[Path]) -> None:
+  for d in paths:
+    shutil.rmtree(d, ignore_errors=True)
+
+def sweep_old_trees(p: Path) -> None:
+  """
+  Deletes {p}.old.* trees left behind by a build that was killed before its
+  background delete finished. Runs on the reset thread list, like the rest.
+  """
+  leftovers = list(p.parent.glob(glob.escape(p.name) + ".old.*"))
+  if leftovers:
+    t = threading.Thread(target=_rmtrees, args=(leftovers,))
+    t.start()
+    _reset_threads.append(t)
+
+def wait_for_resets() -> None:
+  while _reset_threads:
+    _reset_threads.pop().join()
+
 def copy_site_image(*, src_dir: Path, out_dir: Path, filename: str) -> None:
   src = src_dir / filename
-  if not src.exists():
-    raise FileNotFoundError(f"Missing image next to generate.py: {src}")
-  shutil.copyfile(src, out_dir / filename)
-
-def cities_by_state(cities: tuple[CityWithCol, ...]) -> dict[str, list[CityWithCol]]:
-  m: dict[str, list[CityWithCol]] = {}
-  for city, st, col in cities:
-    m.setdefault(st, []).append((city, st, col))
-  for st in m:
-    m[st].sort(key=lambda t: t[0].lower())
-  return m
+  try:
+    st = os.stat(src)
+  except FileNotFoundError:
+    raise FileNotFoundError(f"Missing image next to generate.py: {src}") from None
+
+  # the manifest keys the copy on size + mtime, so an unchanged image
+  # is neither read nor hashed; shutil.copyfile uses sendfile where it can
+  dst = os.fspath(out_dir / filename)
+  if not track_digest(dst, f"stat:{st.st_size}:{st.st_mtime_ns}"):
+    return
+  ensure_dir(os.path.dirname(dst))
+  shutil.copyfile(src, dst)
 
 def linkify_curly(text: str, *, home_href: str) -> str:
   """
@@ -791,13 +721,167 @@ def linkify_curly(text: str, *, home_href: str) -> str:
   """
   parts: list[str] = []
   last = 0
-  for m in re.finditer(r"\{([^}]+)\}", text):
+  for m in _CURLY.finditer(text):
     parts.append(esc(text[last:m.start()]))
     parts.append(f'<a href="{esc(home_href)}">{esc(m.group(1))}</a>')
     last = m.end()
   parts.append(esc(text[last:]))
   return "".join(parts)
 
+@lru_cache(maxsize=None)
+def split_template(text: str) -> tuple[tuple[str, str], ...]:
+  """
+  Parse a "{name}" template once into (literal, name) pairs.
+  The final pair carries the trailing literal and an empty name.
+  """
+  parts: list[tuple[str, str]] = []
+  last = 0
+  for m in _CURLY.finditer(text):
+    parts.append((text[last:m.start()], m.group(1)))
+    last = m.end()
+  parts.append((text[last:], ""))
+  return tuple(parts)
+
+@lru_cache(maxsize=None)
+def percent_template(text: str, names: tuple[str, ...]) -> str:
+  """
+  Compile a "{name}" template once into a %-format string, so filling it
+  is a single C-level `template % values`. Slots not in names stay verbatim.
+  """
+  out: list[str] = []
+  for literal, name in split_template(text):
+    out.append(literal.replace("%", "%%"))
+    if name:
+      out.append(f"%({name})s" if name in names else ("{" + name + "}").replace("%", "%%"))
+  return "".join(out)
+
+
+# ============================================================
+# INCREMENTAL OUTPUT
+# ============================================================
+#
+# Each build records a blake2b hash plus the st_size/st_mtime_ns it left on
+# disk per output file in .build-cache/{output dir}.json next to generate.py
+# (outside the deployed output dir). The next build
+# skips a file only when its bytes didn't change and the file on disk still
+# stats the same, and deletes every file under the output dir it did not
+# produce. A different fingerprint (CSS, CONFIG, mode, copy variant) or
+# --force wipes the directory instead.
+
+BUILD_CACHE_DIR = HERE / ".build-cache"
+
+_out_root: Path | None = None
+_out_prefix = ""  # str(_out_root) + separator, for cheap prefix checks
+# rel path -> [digest, st_size, st_mtime_ns]; entries written this build
+# hold just [digest] until finish_output() stats them
+_prev_files: dict[str, list] = {}  # from the last build
+_new_files: dict[str, list] = {}   # produced by this build
+_skipped = 0
+
+def content_hash(data: bytes) -> str:
+  return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@lru_cache(maxsize=None)
+def build_fingerprint(mode: Mode) -> str:
+  # repr(CONFIG) walks every copy tuple; CONFIG is frozen, so do it once per mode
+  return content_hash(f"{CSS}\n{CONFIG!r}\n{mode}\n{resolve_copy_idx(mode)}".encode("utf-8"))
+
+def manifest_path(out: Path) -> Path:
+  # public/ -> public.json, public/regular/ -> public__regular.json
+  out = out.resolve()
+  try:
+    name = "__".join(out.relative_to(HERE).parts)
+  except ValueError:
+    name = f"{out.name}-{content_hash(os.fspath(out).encode('utf-8'))[:8]}"
+  return BUILD_CACHE_DIR / f"{name}.json"
+
+def begin_output(out: Path, *, mode: Mode, force: bool = False) -> None:
+  global _out_root, _out_prefix, _skipped
+  _out_root = out
+  _out_prefix = os.path.join(os.fspath(out), "")
+  _prev_files.clear()
+  _new_files.clear()
+  _skipped = 0
+  sweep_old_trees(out)
+
+  try:
+    manifest = json.loads(manifest_path(out).read_text(encoding="utf-8"))
+  except (OSError, ValueError):
+    manifest = {}
+
+  if not force and manifest.get("fingerprint") == build_fingerprint(mode):
+    for key, entry in manifest.get("files", {}).items():
+      if isinstance(entry, list) and len(entry) == 3:  # older manifests: rewrite
+        _prev_files[key] = entry
+  else:
+    reset_output_dir(out)
+
+def track_output(path: str, data: bytes) -> bool:
+  """
+  Records path in the manifest; returns False when the file on disk
+  already holds exactly these bytes (same digest, size and mtime as
+  the last build left it).
+  """
+  return track_digest(path, content_hash(data))
+
+def track_digest(path: str, digest: str) -> bool:
+  """
+  track_output() with a precomputed digest (or any token that changes
+  whenever the file's bytes would).
+  """
+  global _skipped
+  if _out_root is None or not path.startswith(_out_prefix):
+    return True  # e.g. wrangler.jsonc next to generate.py
+
+  key = path[len(_out_prefix):]
+  if os.sep != "/":
+    key = key.replace(os.sep, "/")
+  prev = _prev_files.get(key)
+  if prev is not None and prev[0] == digest:
+    try:
+      st = os.stat(path)
+    except FileNotFoundError:
+      pass
+    else:
+      if st.st_size == prev[1] and st.st_mtime_ns == prev[2]:
+        _new_files[key] = prev
+        _skipped += 1
+        return False
+  _new_files[key] = [digest]
+  return True
+
+def prune_untracked(root: str) -> None:
+  """
+  Deletes every file under root this build did not produce (stale pages,
+  or anything a checkout put back), then any directories left empty.
+  """
+  for dirpath, _, filenames in os.walk(root, topdown=False):
+    rel = os.path.relpath(dirpath, root)
+    prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+    for name in filenames:
+      if prefix + name not in _new_files:
+        os.unlink(os.path.join(dirpath, name))
+    if prefix:
+      try:
+        os.rmdir(dirpath)
+      except OSError:
+        pass  # not empty
+
+def finish_output(*, mode: Mode) -> None:
+  assert _out_root is not None
+  wait_for_resets()
+  for key, entry in _new_files.items():
+    if len(entry) == 1:  # written this build: record what it left on disk
+      st = os.stat(_out_prefix + key)
+      entry += (st.st_size, st.st_mtime_ns)
+  prune_untracked(_out_prefix)
+
+  manifest = {"fingerprint": build_fingerprint(mode), "files": _new_files}
+  BUILD_CACHE_DIR.mkdir(exist_ok=True)
+  write_file(manifest_path(_out_root), json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+  if _skipped:
+    print(f"   {_skipped} unchanged files left as-is")
+
 
 # ============================================================
 # MODE + URLS
@@ -835,12 +919,15 @@ def resolve_copy_idx(mode: str) -> int:
   v = max(1, min(5, v))  # clamp 1..5
   return v - 1           # idx 0..4
 
+@lru_cache(maxsize=None)
 def rel_city_path_regular(city: str, st: str) -> str:
   return f"/{slugify(city)}-{slugify(st)}/"
 
+@lru_cache(maxsize=None)
 def rel_city_path_state(city: str, st: str) -> str:
   return f"/{slugify(st)}/{slugify(city)}/"
 
+@lru_cache(maxsize=None)
 def abs_city_origin_subdomain(city: str, st: str) -> str:
   # subdomain slug uses the same {city}-{st} slug
   slug = f"{slugify(city)}-{slugify(st)}"
@@ -850,12 +937,14 @@ def abs_city_origin_subdomain(city: str, st: str) -> str:
     return f"/{slug}/"
   return f"https://{slug}.{base}/"
 
+@lru_cache(maxsize=None)
 def href_home(mode: Mode) -> str:
   if mode == "subdomain":
     # root domain homepage
     return SITE_ORIGIN + "/" if SITE_ORIGIN else "/"
   return "/"
 
+@lru_cache(maxsize=None)
 def href_city(mode: Mode, city: str, st: str) -> str:
   if mode == "state":
     return rel_city_path_state(city, st)
@@ -863,28 +952,99 @@ def href_city(mode: Mode, city: str, st: str) -> str:
     return abs_city_origin_subdomain(city, st)
   return rel_city_path_regular(city, st)
 
+@lru_cache(maxsize=None)
 def href_state(mode: Mode, st: str) -> str:
   # only relevant in state mode; others can ignore
   return f"/{slugify(st)}/"
 
+@lru_cache(maxsize=None)
 def href_cost_index(mode: Mode) -> str:
   # cost index always lives on root domain paths
   return (SITE_ORIGIN + "/cost/") if (mode == "subdomain" and SITE_ORIGIN) else "/cost/"
 
+@lru_cache(maxsize=None)
 def href_howto_index(mode: Mode) -> str:
   return (SITE_ORIGIN + "/how-to/") if (mode == "subdomain" and SITE_ORIGIN) else "/how-to/"
 
+@lru_cache(maxsize=None)
 def href_contact(mode: Mode) -> str:
   return (SITE_ORIGIN + "/contact/") if (mode == "subdomain" and SITE_ORIGIN) else "/contact/"
 
+@lru_cache(maxsize=None)
+def cost_city_href(mode: Mode, city: str, st: str) -> str:
+  # cost pages always on root domain paths
+  if mode == "subdomain" and SITE_ORIGIN:
+    return SITE_ORIGIN + f"/cost/{slugify(city)}-{slugify(st)}/"
+  return f"/cost/{slugify(city)}-{slugify(st)}/"
+
 def canonical_for(mode: Mode, path_or_abs: str) -> str:
   # If already absolute, keep it. Otherwise, upgrade to absolute when SITE_ORIGIN is available.
-  if path_or_abs.startswith("http://") or path_or_abs.startswith("https://"):
-    return path_or_abs
-  if SITE_ORIGIN:
+  if SITE_ORIGIN and not path_or_abs.startswith(("http://", "https://")):
     return SITE_ORIGIN + path_or_abs
   return path_or_abs
 
+def canonical_esc_b(mode: Mode, path_or_abs: str) -> bytes:
+  # Every page has its own canonical, so no caches here: escape + encode directly.
+  return canonical_for(mode, path_or_abs).translate(_ESC_TABLE).encode("utf-8")
+
+
+# ============================================================
+# PRECOMPUTED CITY TABLE
+# ============================================================
+
+class CityMeta(NamedTuple):
+  """A CITIES row plus everything derived from it that pages reuse."""
+  city: str
+  st: str
+  col: float
+  slug: str      # "{city}-{st}"
+  url: str       # "/{slug}/"
+  esc_city: str
+  esc_st: str
+
+def city_meta(row: CityWithCol) -> CityMeta:
+  slug = f"{slugify(row.city)}-{slugify(row.st)}"
+  return CityMeta(*row, slug, f"/{slug}/", esc(row.city), esc(row.st))
+
+# Same order as CITIES, computed once.
+CITY_META: tuple[CityMeta, ...] = tuple(map(city_meta, CITIES))
+
+def cost_range(col: float) -> tuple[int, int]:
+  return int(CONFIG.cost_low * col), int(CONFIG.cost_high * col)
+
+# Local (low, high) price per distinct col; a couple dozen values cover every city.
+COST_RANGES: dict[float, tuple[int, int]] = {col: cost_range(col) for _, _, col in CITIES}
+
+@lru_cache(maxsize=None)
+def city_links_html(mode: Mode) -> str:
+  """
+  <li> links to every city page; identical for all pages of a mode.
+  """
+  return "\n".join([
+    f'<li><a href="{esc(href_city(mode, m.city, m.st))}">{m.esc_city}, {m.esc_st}</a></li>'
+    for m in CITY_META
+  ])
+
+@lru_cache(maxsize=None)
+def cost_city_links_html(mode: Mode) -> str:
+  """
+  <li> links to every city cost page; identical for all pages of a mode.
+  """
+  return "\n".join([
+    f'<li><a href="{esc(cost_city_href(mode, m.city, m.st))}">{m.esc_city}, {m.esc_st}</a></li>'
+    for m in CITY_META
+  ])
+
+@lru_cache(maxsize=None)
+def state_links_html(mode: Mode) -> str:
+  """
+  <li> links to every state page (sorted by abbreviation); one per mode.
+  """
+  return "\n".join([
+    f'<li><a href="{esc(href_state(mode, st))}">{esc(state_full(st))}</a></li>'
+    for st in sorted(CITIES_BY_STATE)
+  ])
+
 
 # ============================================================
 # THEME (small but complete)
@@ -951,11 +1111,61 @@ tbody tr:last-child td{border-bottom:none}
 }
 """.strip()
 
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WS = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+
+def minify_css(css: str) -> str:
+  """
+  Drop comments and whitespace around CSS punctuation. Space before ":"
+  is kept, since it is significant in selectors ("a :hover").
+  """
+  css = _CSS_COMMENT.sub("", css)
+  css = _CSS_WS.sub(" ", css)
+  css = _CSS_PUNCT.sub(r"\1", css).replace(": ", ":")
+  return css.replace(";}", "}").strip()
+
+# CSS stays readable above; pages get the minified form
+CSS_MIN = minify_css(CSS)
+
+# Pages link one shared /styles.<hash>.css (cached across navigations).
+# Env override: CSS_INLINE=1 embeds it in every page's <style> instead.
+CSS_INLINE = (os.environ.get("CSS_INLINE") or "").strip() == "1"
+# content-hashed name: safe to cache forever, a CSS change gets a new URL
+STYLESHEET_FILENAME = f"styles.{content_hash(CSS_MIN.encode('utf-8'))[:8]}.css"
+
+def headers_file() -> str:
+  """
+  Cloudflare/Pages style _headers: long-lived caching for the hashed
+  stylesheet only (HTML stays on the host's default revalidation).
+  """
+  return f"/{STYLESHEET_FILENAME}\n  Cache-Control: public, max-age=31536000, immutable\n"
+
 
 # ============================================================
 # HTML PRIMITIVES
 # ============================================================
 
+# Constant fragments, escaped + encoded once (every page embeds them).
+BRAND_E = esc(CONFIG.brand_name)
+CTA_E = esc(CONFIG.cta_text)
+CSS_B = CSS_MIN.encode("utf-8")
+CSS_HEAD_B = b"<style>\n" + CSS_B + b"\n  </style>"
+BRAND_B = BRAND_E.encode("utf-8")
+
+HEAD_OPEN_B = b"""<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>"""
+
+IMG_B = f"""
+    <div class="img">
+      <img src="/{CONFIG.image_filename}" alt="{filename_to_alt(CONFIG.image_filename)}" loading="lazy" />
+    </div>
+""".rstrip().encode("utf-8")
+
 def nav_html(
   *,
   mode: Mode,
@@ -963,10 +1173,11 @@ def nav_html(
   show_cost: bool = True,
   show_howto: bool = True,
   show_contact: bool = True,
-) -> str:
+) -> bytes:
+  # labels are fixed ASCII words, so only the hrefs need escaping
   def item(href: str, label: str, key: str) -> str:
     cur = ' aria-current="page"' if current == key else ""
-    return f'<a href="{esc(href)}"{cur}>{esc(label)}</a>'
+    return f'<a href="{esc(href)}"{cur}>{label}</a>'
 
   parts: list[str] = []
   parts.append(item(href_home(mode), "Home", "home"))
@@ -977,9 +1188,41 @@ def nav_html(
     parts.append(item(href_howto_index(mode), "How-To", "howto"))
 
   if show_contact:
-    parts.append(f'<a class="btn" href="{esc(href_contact(mode))}">{esc(CONFIG.cta_text)}</a>')
+    parts.append(f'<a class="btn" href="{esc(href_contact(mode))}">{CTA_E}</a>')
+
+  return ('<nav class="nav" aria-label="Primary navigation">' + "".join(parts) + "</nav>").encode("utf-8")
+
 
-  return '<nav class="nav" aria-label="Primary navigation">' + "".join(parts) + "</nav>"
+@lru_cache(maxsize=None)
+def head_tail_html(
+  mode: Mode,
+  current_nav: str,
+  nav_show_cost: bool,
+  nav_show_howto: bool,
+  nav_show_contact: bool,
+) -> bytes:
+  """
+  Everything between the canonical link and the page body (CSS + topbar).
+  It only depends on the mode and nav state, so each combination is
+  rendered once per build instead of once per page.
+  """
+  if CSS_INLINE:
+    css_head = CSS_HEAD_B
+  else:
+    # subdomain pages live on other hosts; the stylesheet is only deployed on SITE_ORIGIN
+    origin = SITE_ORIGIN if mode == "subdomain" else ""
+    css_head = f'<link rel="stylesheet" href="{esc(origin)}/{STYLESHEET_FILENAME}" />'.encode("utf-8")
+  return b"".join([
+    b'" />\n  ',
+    css_head,
+    b'\n</head>\n<body>\n  <div class="topbar">\n    <div class="topbar-inner">\n      <a class="brand" href="',
+    esc(href_home(mode)).encode("utf-8"),
+    b'">',
+    BRAND_B,
+    b"</a>\n      ",
+    nav_html(mode=mode, current=current_nav, show_cost=nav_show_cost, show_howto=nav_show_howto, show_contact=nav_show_contact),
+    b"\n    </div>\n  </div>\n",
+  ])
 
 
 def base_html(
@@ -988,53 +1231,45 @@ def base_html(
   title: str,
   canonical: str,
   current_nav: str,
-  body: str,
+  body: list[bytes],
   nav_show_cost: bool = True,
   nav_show_howto: bool = True,
   nav_show_contact: bool = True,
-) -> str:
-  return f"""<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{esc(title)}</title>
-  <link rel="canonical" href="{esc(canonical_for(mode, canonical))}" />
-  <style>
-{CSS}
-  </style>
-</head>
-<body>
-  <div class="topbar">
-    <div class="topbar-inner">
-      <a class="brand" href="{esc(href_home(mode))}">{esc(CONFIG.brand_name)}</a>
-      {nav_html(mode=mode, current=current_nav, show_cost=nav_show_cost, show_howto=nav_show_howto, show_contact=nav_show_contact)}
-    </div>
-  </div>
-{body}
-</body>
-</html>
-"""
-
-
-def header_block(*, h1: str, sub: str) -> str:
-  return f"""
-<header>
-  <div class="hero">
-    <h1>{esc(h1)}</h1>
-    <p class="sub">{esc(sub)}</p>
-  </div>
-</header>
-""".rstrip()
-
-def footer_block(*, mode: Mode, show_cta: bool = True, show_cost: bool = True, show_howto: bool = True) -> str:
+) -> list[bytes]:
+  return [
+    HEAD_OPEN_B,
+    esc(title).encode("utf-8"),
+    b'</title>\n  <link rel="canonical" href="',
+    canonical_esc_b(mode, canonical),
+    head_tail_html(mode, current_nav, nav_show_cost, nav_show_howto, nav_show_contact),
+    *body,
+    b"\n</body>\n</html>\n",
+  ]
+
+
+@lru_cache(maxsize=None)
+def esc_b(s: str) -> bytes:
+  # escaped + encoded once; for strings every page repeats (CONFIG subs)
+  return esc(s).encode("utf-8")
+
+def header_block(*, h1: str, sub: str) -> list[bytes]:
+  return [
+    b'\n<header>\n  <div class="hero">\n    <h1>',
+    esc(h1).encode("utf-8"),
+    b'</h1>\n    <p class="sub">',
+    esc_b(sub),
+    b"</p>\n  </div>\n</header>",
+  ]
+
+@lru_cache(maxsize=None)
+def footer_block(*, mode: Mode, show_cta: bool = True, show_cost: bool = True, show_howto: bool = True) -> bytes:
   cta_html = ""
   if show_cta:
     cta_html = f"""
     <h2>Next steps</h2>
     <p class="sub">Ready to move forward? Request a free quote.</p>
     <div>
-      <a class="btn" href="{esc(href_contact(mode))}">{esc(CONFIG.cta_text)}</a>
+      <a class="btn" href="{esc(href_contact(mode))}">{CTA_E}</a>
     </div>
 """.rstrip()
 
@@ -1051,59 +1286,35 @@ def footer_block(*, mode: Mode, show_cta: bool = True, show_cost: bool = True, s
     <div class="footer-links">
       {''.join(links)}
     </div>
-    <div class="small">© {esc(CONFIG.brand_name)}. All rights reserved.</div>
+    <div class="small">© {BRAND_E}. All rights reserved.</div>
   </div>
 </footer>
-""".rstrip()
-
-
-  return f"""
-<footer>
-  <div class="footer-inner">
-    {cta_html}
-    <div class="footer-links">
-      <a href="{esc(href_home(mode))}">Home</a>
-      <a href="{esc(href_cost_index(mode))}">Cost</a>
-      <a href="{esc(href_howto_index(mode))}">How-To</a>
-    </div>
-    <div class="small">© {esc(CONFIG.brand_name)}. All rights reserved.</div>
-  </div>
-</footer>
-""".rstrip()
+""".rstrip().encode("utf-8")
 
 def page_shell(
   *,
   h1: str,
   sub: str,
   inner_html: str,
+  inner_head: bytes = b"",  # pre-encoded HTML placed right before inner_html
+  inner_tail: bytes = b"",  # pre-encoded HTML placed right after inner_html
   show_image: bool,
   show_footer_cta: bool,
   mode: Mode,
   footer_show_cost: bool = True,
   footer_show_howto: bool = True,
-) -> str:
-  img_src = f"/{CONFIG.image_filename}"
-  img_alt = filename_to_alt(CONFIG.image_filename)
-  img_html = ""
-  if show_image:
-    img_html = f"""
-    <div class="img">
-      <img src="{img_src}" alt="{img_alt}" loading="lazy" />
-    </div>
-""".rstrip()
-
-  return (
-    header_block(h1=h1, sub=sub)
-    + f"""
-<main>
-  <section class="card">
-{img_html}
-    {inner_html}
-  </section>
-</main>
-"""
-    + footer_block(mode=mode, show_cta=show_footer_cta, show_cost=footer_show_cost, show_howto=footer_show_howto)
-  ).rstrip()
+) -> list[bytes]:
+  return [
+    *header_block(h1=h1, sub=sub),
+    b'\n<main>\n  <section class="card">\n',
+    IMG_B if show_image else b"",
+    b"\n    ",
+    inner_head,
+    inner_html.encode("utf-8"),
+    inner_tail,
+    b"\n  </section>\n</main>\n",
+    footer_block(mode=mode, show_cta=show_footer_cta, show_cost=footer_show_cost, show_howto=footer_show_howto),
+  ]
 
 def make_page(
   *,
@@ -1113,6 +1324,8 @@ def make_page(
   nav_key: str,
   sub: str,
   inner: str,
+  inner_head: bytes = b"",
+  inner_tail: bytes = b"",
   show_image: bool = True,
   show_footer_cta: bool = True,
   nav_show_cost: bool = True,
@@ -1120,8 +1333,8 @@ def make_page(
   nav_show_contact: bool = True,
   footer_show_cost: bool = True,
   footer_show_howto: bool = True,
-) -> str:
-  h1 = clamp_title(h1, 70)
+) -> list[bytes]:
+  h1 = clamp_title(h1, 70)  # the only clamp; factories pass raw h1s
   title = h1  # enforce title == h1
 
   return base_html(
@@ -1136,6 +1349,8 @@ def make_page(
       h1=h1,
       sub=sub,
       inner_html=inner,
+      inner_head=inner_head,
+      inner_tail=inner_tail,
       show_image=show_image,
       show_footer_cta=show_footer_cta,
       mode=mode,
@@ -1144,27 +1359,53 @@ def make_page(
     ),
   )
 
+@lru_cache(maxsize=None)
 def make_section(*, headings: tuple[str, ...], paras: tuple[str, ...]) -> str:
-
+  # only ever called with CONFIG tuples, so every city page shares one render
   parts: list[str] = []
   for h2, p in zip(headings, paras):
     parts.append(f"<h2>{esc(h2)}</h2>")
     parts.append(f"<p>{esc(p)}</p>")
   return "\n".join(parts)
 
+@lru_cache(maxsize=None)
+def main_section_b(copy_idx: int, lead: str = "") -> bytes:
+  # lead + the CONFIG main copy, encoded once; spliced into every city page
+  return (lead + make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[copy_idx])).encode("utf-8")
+
+
+def link_grid_html(heading: str, intro: str, links: str) -> str:
+  # "<hr /> + heading + intro + <ul class=city-grid>" block used by the index pages
+  return "".join([
+    "\n<hr />\n<h2>", heading, '</h2>\n<p class="muted">', intro, '</p>\n<ul class="city-grid">\n',
+    links,
+    "\n</ul>\n",
+  ])
+
+
+LOCATION_SLOTS = ("loc", "cost_lo", "cost_hi")
+
+@lru_cache(maxsize=None)
+def cost_strong(col: float) -> tuple[str, str]:
+  lo, hi = COST_RANGES.get(col) or cost_range(col)
+  return f"<strong>${lo}</strong>", f"<strong>${hi}</strong>"
 
 def location_cost_section(city: str="", st: str="", col: float=1) -> str:
+  return location_cost_html(city, st, col, COPY_IDX)
+
+@lru_cache(maxsize=None)
+def location_cost_html(city: str, st: str, col: float, copy_idx: int) -> str:
+  """
+  Cached on the full input: cost mode renders the same snippet for a
+  city's page and its cost page, and "all" reuses it across modes
+  sharing a copy variant.
+  """
   rep = f" in {city}, {st}" if city and st else ""
-  cost_lo = f"<strong>${int(CONFIG.cost_low * col)}</strong>"
-  cost_hi = f"<strong>${int(CONFIG.cost_high * col)}</strong>"
-
-  h2 = CONFIG.location_cost_h2.replace("{loc}", rep)
-  p = (
-    CONFIG.location_cost_p[COPY_IDX]
-    .replace("{loc}", rep)
-    .replace("{cost_lo}", cost_lo)
-    .replace("{cost_hi}", cost_hi)
-  )
+  cost_lo, cost_hi = cost_strong(col)
+
+  values = {"loc": rep, "cost_lo": cost_lo, "cost_hi": cost_hi}
+  h2 = percent_template(CONFIG.location_cost_h2, LOCATION_SLOTS) % values
+  p = percent_template(CONFIG.location_cost_p[copy_idx], LOCATION_SLOTS) % values
 
   return f"<h2>{esc(h2)}</h2>\n<p>{p}</p>"
 
@@ -1173,26 +1414,14 @@ def location_cost_section(city: str="", st: str="", col: float=1) -> str:
 # PAGE CONTENT FACTORIES
 # ============================================================
 
-def homepage_html(*, mode: Mode) -> str:
-  links = "\n".join(
-    f'<li><a href="{esc(href_city(mode, c, s))}">{esc(c)}, {esc(s)}</a></li>'
-    for c, s, _ in CITIES
-  )
+def homepage_html(*, mode: Mode) -> list[bytes]:
+  links = city_links_html(mode)
 
-  inner = (
-    f"<p>{esc(CONFIG.about_blurb[COPY_IDX])}</p>\n"
-    + make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX])
-    + """
-<hr />
-<h2>Choose your city</h2>
-<p class="muted">We provide services nationwide, including in the following cities:</p>
-<ul class="city-grid">
-"""
-    + links
-    + """
-</ul>
-"""
-  )
+  inner = "".join([
+    f"<p>{esc(CONFIG.about_blurb[COPY_IDX])}</p>\n",
+    make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX]),
+    link_grid_html("Choose your city", "We provide services nationwide, including in the following cities:", links),
+  ])
 
   return make_page(
     mode=mode,
@@ -1203,7 +1432,7 @@ def homepage_html(*, mode: Mode) -> str:
     inner=inner,
   )
 
-def contact_page_html(*, mode: Mode) -> str:
+def contact_page_html(*, mode: Mode) -> list[bytes]:
   h1 = "Get Your Free Estimate"
   sub = "Fill out the form below and we’ll connect you with a qualified local professional."
 
@@ -1223,40 +1452,39 @@ def contact_page_html(*, mode: Mode) -> str:
     show_footer_cta=False,
   )
 
-def city_page_html(*, mode: Mode, city: str, st: str, col: float, canonical: str) -> str:
-  inner = (
-    make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX])
-    + location_cost_section(city, st, col)
+def city_page_html(*, mode: Mode, city: str, st: str, col: float, canonical: str) -> list[bytes]:
+  return make_page(
+    mode=mode,
+    h1=f"{CONFIG.h1_short} in {city}, {st}",
+    canonical=canonical,
+    nav_key="home",
+    sub=CONFIG.h1_sub,
+    inner_head=main_section_b(COPY_IDX),
+    inner=location_cost_section(city, st, col),
   )
 
+def city_only_page_html(*, mode: Mode, city: str, st: str, col: float, canonical: str) -> list[bytes]:
+  # regular_city_only: cost snippet first, Cost/How-To hidden from nav + footer
   return make_page(
     mode=mode,
-    h1=clamp_title(f"{CONFIG.h1_short} in {city}, {st}", 70),
+    h1=f"{CONFIG.h1_short} in {city}, {st}",
     canonical=canonical,
     nav_key="home",
     sub=CONFIG.h1_sub,
-    inner=inner,
+    inner=location_cost_section(city, st, col),
+    inner_tail=main_section_b(COPY_IDX, "<hr />\n"),
+    nav_show_cost=False,
+    nav_show_howto=False,
+    footer_show_cost=False,
+    footer_show_howto=False,
+    show_footer_cta=True,
+    nav_show_contact=True,
   )
 
-def cost_page_html(*, mode: Mode, include_city_index: bool) -> str:
-  inner = location_cost_section() + COST_INNER
+def cost_page_html(*, mode: Mode, include_city_index: bool) -> list[bytes]:
+  inner = location_cost_section() + cost_inner()
   if include_city_index:
-    links = "\n".join(
-      f'<li><a href="{esc(cost_city_href(mode, c, s))}">{esc(c)}, {esc(s)}</a></li>'
-      for c, s, _ in CITIES
-    )
-    inner += (
-      """
-<hr />
-<h2>Choose your city</h2>
-<p class="muted">See local price ranges by city:</p>
-<ul class="city-grid">
-"""
-      + links
-      + """
-</ul>
-"""
-    )
+    inner += link_grid_html("Choose your city", "See local price ranges by city:", cost_city_links_html(mode))
 
   return make_page(
     mode=mode,
@@ -1267,18 +1495,10 @@ def cost_page_html(*, mode: Mode, include_city_index: bool) -> str:
     inner=inner,
   )
 
-def cost_city_href(mode: Mode, city: str, st: str) -> str:
-  # cost pages always on root domain paths
-  if mode == "subdomain" and SITE_ORIGIN:
-    return SITE_ORIGIN + f"/cost/{slugify(city)}-{slugify(st)}/"
-  return f"/cost/{slugify(city)}-{slugify(st)}/"
-
-def cost_city_page_html(*, mode: Mode, city: str, st: str, col: float) -> str:
+def cost_city_page_html(*, mode: Mode, city: str, st: str, col: float) -> list[bytes]:
   # canonical for the city cost page path
   canonical = f"/cost/{slugify(city)}-{slugify(st)}/"
-  h1 = clamp_title(f"{CONFIG.cost_title} in {city}, {st}", 70)
-
-  inner = location_cost_section(city, st, col) + COST_INNER
+  h1 = f"{CONFIG.cost_title} in {city}, {st}"
 
   return make_page(
     mode=mode,
@@ -1286,10 +1506,11 @@ def cost_city_page_html(*, mode: Mode, city: str, st: str, col: float) -> str:
     canonical=canonical,
     nav_key="cost",
     sub=CONFIG.cost_sub,
-    inner=inner,
+    inner=location_cost_section(city, st, col),
+    inner_tail=cost_inner_b(),
   )
 
-def howto_page_html(*, mode: Mode) -> str:
+def howto_page_html(*, mode: Mode) -> list[bytes]:
   inner = HOWTO_INNER
   return make_page(
     mode=mode,
@@ -1300,29 +1521,14 @@ def howto_page_html(*, mode: Mode) -> str:
     inner=inner,
   )
 
-def state_homepage_html(*, mode: Mode) -> str:
-  by_state = cities_by_state(CITIES)
-  states = sorted(by_state.keys())
-
-  links = "\n".join(
-    f'<li><a href="{esc(href_state(mode, st))}">{esc(state_full(st))}</a></li>'
-    for st in states
-  )
+def state_homepage_html(*, mode: Mode) -> list[bytes]:
+  links = state_links_html(mode)
 
-  inner = (
-    f"<p>{esc(CONFIG.about_blurb[COPY_IDX])}</p>\n"
-    + make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX])
-    + """
-<hr />
-<h2>Choose your state</h2>
-<p class="muted">We provide services nationwide, including in the following states:</p>
-<ul class="city-grid">
-"""
-    + links
-    + """
-</ul>
-"""
-  )
+  inner = "".join([
+    f"<p>{esc(CONFIG.about_blurb[COPY_IDX])}</p>\n",
+    make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX]),
+    link_grid_html("Choose your state", "We provide services nationwide, including in the following states:", links),
+  ])
 
   return make_page(
     mode=mode,
@@ -1333,11 +1539,11 @@ def state_homepage_html(*, mode: Mode) -> str:
     inner=inner,
   )
 
-def state_page_html(*, mode: Mode, st: str, cities: list[CityWithCol]) -> str:
-  links = "\n".join(
+def state_page_html(*, mode: Mode, st: str, cities: tuple[str, ...]) -> list[bytes]:
+  links = "\n".join([
     f'<li><a href="{esc(href_city(mode, c, st))}">{esc(c)}, {esc(st)}</a></li>'
-    for c, st, _ in cities
-  )
+    for c in cities
+  ])
 
   inner = f"""
 <h2>Cities we serve in {esc(state_full(st))}</h2>
@@ -1349,7 +1555,7 @@ def state_page_html(*, mode: Mode, st: str, cities: list[CityWithCol]) -> str:
 
   return make_page(
     mode=mode,
-    h1=clamp_title(f"{CONFIG.h1_short} in {state_full(st)}", 70),
+    h1=f"{CONFIG.h1_short} in {state_full(st)}",
     canonical=f"/{slugify(st)}/",
     nav_key="home",
     sub=CONFIG.h1_sub,
@@ -1364,113 +1570,201 @@ def state_page_html(*, mode: Mode, st: str, cities: list[CityWithCol]) -> str:
 def robots_txt() -> str:
   return "User-agent: *\nAllow: /\nSitemap: /sitemap.xml\n"
 
-def sitemap_xml(urls: list[str]) -> str:
-  return (
-    '<?xml version="1.0" encoding="UTF-8"?>\n'
-    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    + "".join(f"  <url><loc>{esc(u)}</loc></url>\n" for u in urls)
-    + "</urlset>\n"
-  )
+SITEMAP_HEAD_B = (
+  b'<?xml version="1.0" encoding="UTF-8"?>\n'
+  b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_TAIL_B = b"</urlset>\n"
+
+@dataclass
+class Sitemap:
+  """
+  sitemap.xml assembled while pages are queued, so the URL list is never
+  walked a second time. `count` doubles as the generated page count.
+  """
+  mode: Mode
+  buf: bytearray = field(default_factory=lambda: bytearray(SITEMAP_HEAD_B))
+  count: int = 0
+
+  def add(self, path_or_abs: str) -> None:
+    # extend in place: no temporary bytes per URL
+    buf = self.buf
+    buf += b"  <url><loc>"
+    buf += canonical_esc_b(self.mode, path_or_abs)
+    buf += b"</loc></url>\n"
+    self.count += 1
+
+  def to_bytes(self) -> bytes:
+    return b"".join((self.buf, SITEMAP_TAIL_B))
 
 def wrangler_content() -> str:
   name = CONFIG.base_name.lower().replace(" ", "-")
   today = date.today().isoformat()
-  return f"""{{
-  "name": "{name}",
-  "compatibility_date": "{today}",
-  "assets": {{
-    "directory": "./public"
-  }}
-}}
-"""
+  config = {"name": name, "compatibility_date": today, "assets": {"directory": "./public"}}
+  return json.dumps(config, indent=2, ensure_ascii=False) + "\n"
 
 
 # ============================================================
-# BUILD MODES
+# PARALLEL RENDERING
 # ============================================================
 
-def build_common(*, out: Path, mode: Mode) -> list[str]:
+# (output path as str, page factory, factory kwargs)
+PageJob = tuple[str, Callable[..., list[bytes]], dict[str, object]]
+
+RENDER_CHUNKSIZE = 64
+
+def build_workers() -> int:
   """
-  Writes shared core pages for all modes.
-  Returns list of sitemap URLs.
+  Env override: BUILD_WORKERS=N (1 renders in-process).
+  Otherwise uses every CPU.
   """
-  write_text(out / "cost" / "index.html", cost_page_html(mode=mode, include_city_index=(mode == "cost")))
-  write_text(out / "how-to" / "index.html", howto_page_html(mode=mode))
-  write_text(out / "contact" / "index.html", contact_page_html(mode=mode))
+  raw = (os.environ.get("BUILD_WORKERS") or "").strip()
+  if raw.isdigit():
+    return max(1, int(raw))
+  return os.cpu_count() or 1
 
-  urls = ["/", "/cost/", "/how-to/", "/contact/"]
-  return urls
+def pool_context() -> multiprocessing.context.BaseContext | None:
+  """
+  Fork where the platform allows it, so workers start with this process's
+  warm lru caches (slugs, escapes, nav/head fragments, city link lists)
+  instead of re-importing and rebuilding them.
+  """
+  if "fork" in multiprocessing.get_all_start_methods():
+    return multiprocessing.get_context("fork")
+  return None
 
-def build_regular(*, out: Path) -> None:
-  mode: Mode = "regular"
-  urls = build_common(out=out, mode=mode)
-  write_text(out / "index.html", homepage_html(mode=mode))
+def _init_worker(copy_idx: int) -> None:
+  # spawned workers re-derive COPY_IDX from argv; "all" switches it per mode
+  global COPY_IDX
+  COPY_IDX = copy_idx
 
-  for city, st, col in CITIES:
-    path = out / slugify(city) + "-" + slugify(st) / "index.html"  # incorrect type if not careful
+def _render_job(job: tuple[Callable[..., list[bytes]], dict[str, object]]) -> bytes:
+  fn, kwargs = job
+  return b"".join(fn(**kwargs))
 
-def build_regular(*, out: Path) -> None:
-  mode: Mode = "regular"
-  urls = build_common(out=out, mode=mode)
-  write_text(out / "index.html", homepage_html(mode=mode))
+def render_pages(jobs: list[PageJob]) -> None:
+  """
+  Renders page jobs in worker processes and writes them from this process
+  (so the incremental manifest sees every file). Small builds stay serial.
+  """
+  create_parent_dirs(path for path, _, _ in jobs)
 
-  for city, st, col in CITIES:
-    slug = f"{slugify(city)}-{slugify(st)}"
-    write_text(out / slug / "index.html", city_page_html(mode=mode, city=city, st=st, col=col, canonical=f"/{slug}/"))
-    urls.append(f"/{slug}/")
+  workers = build_workers()
+  if workers <= 1 or len(jobs) <= RENDER_CHUNKSIZE:
+    for path, fn, kwargs in jobs:
+      write_bytes(path, fn(**kwargs), make_dirs=False)
+    return
 
+  wait_for_resets()  # don't fork while the delete thread is running
+
+  # render one page here first so the shared per-mode fragments are cached
+  # before the workers fork
+  path, fn, kwargs = jobs[0]
+  write_bytes(path, fn(**kwargs), make_dirs=False)
+
+  rest = jobs[1:]
+  with ProcessPoolExecutor(
+    max_workers=workers,
+    mp_context=pool_context(),
+    initializer=_init_worker,
+    initargs=(COPY_IDX,),
+  ) as ex:
+    rendered = ex.map(_render_job, [(fn, kwargs) for _, fn, kwargs in rest], chunksize=RENDER_CHUNKSIZE)
+    for (path, _, _), data in zip(rest, rendered):
+      write_bytes(path, [data], make_dirs=False)
+
+
+# ============================================================
+# BUILD MODES
+# ============================================================
+#
+# Each builder writes its few index pages and returns a BuildPlan: the
+# per-city page jobs plus the filled sitemap. build_mode() renders the
+# jobs and writes the shared tail, so all modes share one pipeline.
+
+# (page jobs to render, sitemap for every page of the mode)
+BuildPlan = tuple[list[PageJob], Sitemap]
+
+def build_common(*, out: Path, mode: Mode) -> Sitemap:
+  """
+  Writes shared core pages for all modes.
+  Returns the sitemap, seeded with their URLs.
+  """
+  write_bytes(out / "cost" / "index.html", cost_page_html(mode=mode, include_city_index=(mode == "cost")))
+  write_bytes(out / "how-to" / "index.html", howto_page_html(mode=mode))
+  write_bytes(out / "contact" / "index.html", contact_page_html(mode=mode))
+
+  sitemap = Sitemap(mode)
+  for u in ("/", "/cost/", "/how-to/", "/contact/"):
+    sitemap.add(u)
+  return sitemap
+
+def write_site_files(*, out: Path, sitemap: Sitemap) -> None:
+  """
+  Writes the files every mode ends with: robots.txt, sitemap.xml.
+  (wrangler.jsonc is shared by all modes; main() writes it once per run.)
+  """
   write_text(out / "robots.txt", robots_txt())
-  write_text(out / "sitemap.xml", sitemap_xml([canonical_for(mode, u) for u in urls]))
-  write_text(Path(__file__).resolve().parent / "wrangler.jsonc", wrangler_content())
-  print(f"✅ regular: Generated {len(urls)} pages into: {out.resolve()}")
+  write_bytes(out / "sitemap.xml", [sitemap.to_bytes()])
+
+def build_regular(*, out: Path) -> BuildPlan:
+  mode: Mode = "regular"
+  sitemap = build_common(out=out, mode=mode)
+  write_bytes(out / "index.html", homepage_html(mode=mode))
 
-def build_cost(*, out: Path) -> None:
+  root = os.fspath(out)
+  jobs: list[PageJob] = []
+  for m in CITY_META:
+    jobs.append((f"{root}/{m.slug}/index.html", city_page_html, dict(mode=mode, city=m.city, st=m.st, col=m.col, canonical=m.url)))
+    sitemap.add(m.url)
+  return jobs, sitemap
+
+def build_cost(*, out: Path) -> BuildPlan:
   mode: Mode = "cost"
-  urls = build_common(out=out, mode=mode)
-  write_text(out / "index.html", homepage_html(mode=mode))
+  sitemap = build_common(out=out, mode=mode)
+  write_bytes(out / "index.html", homepage_html(mode=mode))
 
-  # city pages
-  for city, st, col in CITIES:
-    slug = f"{slugify(city)}-{slugify(st)}"
-    write_text(out / slug / "index.html", city_page_html(mode=mode, city=city, st=st, col=col, canonical=f"/{slug}/"))
-    urls.append(f"/{slug}/")
+  root = os.fspath(out)
+  jobs: list[PageJob] = []
+  cost_paths: list[str] = []
 
-  # city cost pages
-  for city, st, col in CITIES:
-    slug = f"{slugify(city)}-{slugify(st)}"
-    write_text(out / "cost" / slug / "index.html", cost_city_page_html(mode=mode, city=city, st=st, col=col))
-    urls.append(f"/cost/{slug}/")
+  # city pages + city cost pages in one pass (cost URLs follow in the sitemap)
+  for m in CITY_META:
+    jobs.append((f"{root}/{m.slug}/index.html", city_page_html, dict(mode=mode, city=m.city, st=m.st, col=m.col, canonical=m.url)))
+    jobs.append((f"{root}/cost/{m.slug}/index.html", cost_city_page_html, dict(mode=mode, city=m.city, st=m.st, col=m.col)))
+    sitemap.add(m.url)
+    cost_paths.append("/cost" + m.url)
+  for u in cost_paths:
+    sitemap.add(u)
 
-  write_text(out / "robots.txt", robots_txt())
-  write_text(out / "sitemap.xml", sitemap_xml([canonical_for(mode, u) for u in urls]))
-  write_text(Path(__file__).resolve().parent / "wrangler.jsonc", wrangler_content())
-  print(f"✅ cost: Generated {len(urls)} pages into: {out.resolve()}")
+  return jobs, sitemap
 
-def build_state(*, out: Path) -> None:
+def build_state(*, out: Path) -> BuildPlan:
   mode: Mode = "state"
-  urls = build_common(out=out, mode=mode)
-  write_text(out / "index.html", state_homepage_html(mode=mode))
+  sitemap = build_common(out=out, mode=mode)
+  write_bytes(out / "index.html", state_homepage_html(mode=mode))
+
+  root = os.fspath(out)
+  jobs: list[PageJob] = []
+  by_state = CITIES_BY_STATE
+  for st, (names, cols) in by_state.items():
+    st_slug = slugify(st)
+    st_dir = f"{root}/{st_slug}"
 
-  by_state = cities_by_state(CITIES)
-  for st, city_list in by_state.items():
     # /{st}/
-    write_text(out / slugify(st) / "index.html", state_page_html(mode=mode, st=st, cities=city_list))
-    urls.append(f"/{slugify(st)}/")
+    jobs.append((f"{st_dir}/index.html", state_page_html, dict(mode=mode, st=st, cities=names)))
+    sitemap.add(f"/{st_slug}/")
 
     # /{st}/{city}/
-    for city, _, col in city_list:
-      write_text(
-        out / slugify(st) / slugify(city) / "index.html",
-        city_page_html(mode=mode, city=city, st=st, col=col, canonical=f"/{slugify(st)}/{slugify(city)}/")
-      )
-      urls.append(f"/{slugify(st)}/{slugify(city)}/")
+    for city, col in zip(names, cols):
+      city_slug = slugify(city)
+      path = f"/{st_slug}/{city_slug}/"
+      jobs.append((f"{st_dir}/{city_slug}/index.html", city_page_html, dict(mode=mode, city=city, st=st, col=col, canonical=path)))
+      sitemap.add(path)
 
-  write_text(out / "robots.txt", robots_txt())
-  write_text(out / "sitemap.xml", sitemap_xml([canonical_for(mode, u) for u in urls]))
-  write_text(Path(__file__).resolve().parent / "wrangler.jsonc", wrangler_content())
-  print(f"✅ state: Generated {len(urls)} pages into: {out.resolve()}")
+  return jobs, sitemap
 
-def build_subdomain(*, out: Path) -> None:
+def build_subdomain(*, out: Path) -> BuildPlan:
   """
   We still output city pages into folders (for local preview / static host fallback),
   but in subdomain mode the links + canonicals for city pages are absolute:
@@ -1481,30 +1775,24 @@ def build_subdomain(*, out: Path) -> None:
     - City pages are meant to be served via host-based rewrites (Vercel/Cloudflare).
   """
   mode: Mode = "subdomain"
-  urls = build_common(out=out, mode=mode)
+  sitemap = build_common(out=out, mode=mode)
 
   # root homepage lists city links as absolute subdomains
-  write_text(out / "index.html", homepage_html(mode=mode))
+  write_bytes(out / "index.html", homepage_html(mode=mode))
 
   # city pages (rendered into folders for local preview),
   # but canonical is absolute subdomain origin
-  for city, st, col in CITIES:
-    slug = f"{slugify(city)}-{slugify(st)}"
-    city_origin = abs_city_origin_subdomain(city, st)  # ends with /
+  root = os.fspath(out)
+  jobs: list[PageJob] = []
+  for m in CITY_META:
+    city_origin = abs_city_origin_subdomain(m.city, m.st)  # ends with /
     # write to /{slug}/index.html for preview
-    write_text(
-      out / slug / "index.html",
-      city_page_html(mode=mode, city=city, st=st, col=col, canonical=city_origin)
-    )
+    jobs.append((f"{root}/{m.slug}/index.html", city_page_html, dict(mode=mode, city=m.city, st=m.st, col=m.col, canonical=city_origin)))
     # sitemap should include absolute city origins when possible
-    urls.append(city_origin)
+    sitemap.add(city_origin)
+  return jobs, sitemap
 
-  write_text(out / "robots.txt", robots_txt())
-  write_text(out / "sitemap.xml", sitemap_xml([canonical_for(mode, u) for u in urls]))
-  write_text(Path(__file__).resolve().parent / "wrangler.jsonc", wrangler_content())
-  print(f"✅ subdomain: Generated {len(urls)} pages into: {out.resolve()}")
-
-def build_regular_city_only(*, out: Path) -> None:
+def build_regular_city_only(*, out: Path) -> BuildPlan:
   """
   regular_city_only:
     - Generates / (homepage) + city pages /{city-st}/
@@ -1513,10 +1801,12 @@ def build_regular_city_only(*, out: Path) -> None:
     - Keeps Contact CTA (you can disable it too if you want)
   """
   mode: Mode = "regular_city_only"
-  urls: list[str] = ["/", "/contact/"]  # contact page still generated
+  sitemap = Sitemap(mode)
+  sitemap.add("/")
+  sitemap.add("/contact/")  # contact page still generated
 
   # Homepage (keep the city grid; hide Cost/How-To nav + footer links)
-  write_text(
+  write_bytes(
     out / "index.html",
     make_page(
       mode=mode,
@@ -1524,22 +1814,10 @@ def build_regular_city_only(*, out: Path) -> None:
       canonical="/",
       nav_key="home",
       sub=CONFIG.h1_sub,
-      inner=(
-        make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX],)
-        + """
-<hr />
-<h2>Choose your city</h2>
-<p class="muted">We provide services nationwide, including in the following cities:</p>
-<ul class="city-grid">
-"""
-        + "\n".join(
-          f'<li><a href="{esc(href_city(mode, c, s))}">{esc(c)}, {esc(s)}</a></li>'
-          for c, s, _ in CITIES
-        )
-        + """
-</ul>
-"""
-      ),
+      inner="".join([
+        make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX]),
+        link_grid_html("Choose your city", "We provide services nationwide, including in the following cities:", city_links_html(mode)),
+      ]),
       nav_show_cost=False,
       nav_show_howto=False,
       footer_show_cost=False,
@@ -1550,56 +1828,39 @@ def build_regular_city_only(*, out: Path) -> None:
   )
 
   # Contact page (still useful since CTA exists)
-  write_text(
+  write_bytes(
     out / "contact" / "index.html",
     contact_page_html(mode=mode),
   )
 
   # City pages (exact same content as your existing city_page_html; only nav/footer differ)
-  for city, st, col in CITIES:
-    slug = f"{slugify(city)}-{slugify(st)}"
-    write_text(
-      out / slug / "index.html",
-      make_page(
-        mode=mode,
-        h1=f"{CONFIG.h1_short} in {city}, {st}",
-        canonical=f"/{slug}/",
-        nav_key="home",
-        sub=CONFIG.h1_sub,
-        inner=(
-          location_cost_section(city, st, col, home_href=href_home(mode))
-          + "<hr />\n"
-          + make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p[COPY_IDX])
-        ),
-        nav_show_cost=False,
-        nav_show_howto=False,
-        footer_show_cost=False,
-        footer_show_howto=False,
-        show_footer_cta=True,
-        nav_show_contact=True,
-      ),
-    )
-    urls.append(f"/{slug}/")
-
-  write_text(out / "robots.txt", robots_txt())
-  write_text(out / "sitemap.xml", sitemap_xml([canonical_for(mode, u) for u in urls]))
-  write_text(Path(__file__).resolve().parent / "wrangler.jsonc", wrangler_content())
-  print(f"✅ regular_city_only: Generated {len(urls)} pages into: {out.resolve()}")
+  root = os.fspath(out)
+  jobs: list[PageJob] = []
+  for m in CITY_META:
+    jobs.append((f"{root}/{m.slug}/index.html", city_only_page_html, dict(mode=mode, city=m.city, st=m.st, col=m.col, canonical=m.url)))
+    sitemap.add(m.url)
+  return jobs, sitemap
 
 
 # ============================================================
 # ENTRYPOINT
 # ============================================================
 
-VALID_MODES: set[str] = {
-  "regular",
-  "cost",
-  "state",
-  "subdomain",
-  "regular_city_only",
+BUILDERS: dict[Mode, Callable[..., BuildPlan]] = {
+  "regular": build_regular,
+  "cost": build_cost,
+  "state": build_state,
+  "subdomain": build_subdomain,
+  "regular_city_only": build_regular_city_only,
 }
 
-SITE_MODE: Mode = sys.argv[1] if len(sys.argv) > 1 else "regular"
+# "all" builds every mode, each into {output_dir}/{mode}/ (in parallel when BUILD_WORKERS > 1)
+VALID_MODES: set[str] = {*BUILDERS, "all"}
+
+# --force ignores the incremental manifest and rebuilds from an empty output dir
+ARGS = [a for a in sys.argv[1:] if a != "--force"]
+FORCE_REBUILD = len(ARGS) < len(sys.argv) - 1
+SITE_MODE: Mode = ARGS[0] if ARGS else "regular"
 COPY_IDX: int = resolve_copy_idx(SITE_MODE)
 
 if SITE_MODE not in VALID_MODES:
@@ -1608,25 +1869,82 @@ if SITE_MODE not in VALID_MODES:
     f"Choose one of: {', '.join(sorted(VALID_MODES))}"
   )
 
+def all_modes() -> list[Mode]:
+  """
+  Modes built by `generate.py all`.
+  Env override: SITE_MODES=regular,cost (comma-separated)
+  Otherwise every mode.
+  """
+  raw = (os.environ.get("SITE_MODES") or "").strip()
+  modes = [m.strip() for m in raw.split(",") if m.strip()]
+  for m in modes:
+    if m not in BUILDERS:
+      raise ValueError(f"Invalid SITE_MODES entry {m!r}. Choose from: {', '.join(BUILDERS)}")
+  return modes or list(BUILDERS)
+
+if SITE_MODE == "all":
+  all_modes()  # validate SITE_MODES now, so a typo fails before any output is touched
+
+def build_mode(mode: Mode, out: Path) -> None:
+  global COPY_IDX
+  COPY_IDX = resolve_copy_idx(mode)
+
+  begin_output(out, mode=mode, force=FORCE_REBUILD)
+  copy_site_image(src_dir=HERE, out_dir=out, filename=CONFIG.image_filename)
+  if not CSS_INLINE:
+    write_text(out / STYLESHEET_FILENAME, CSS_MIN + "\n")
+    write_text(out / "_headers", headers_file())
+  if PRECOMPRESS:
+    write_text(out / ".assetsignore", "*.gz\n")  # wrangler would publish them as separate URLs
+  jobs, sitemap = BUILDERS[mode](out=out)
+  render_pages(jobs)
+  write_site_files(out=out, sitemap=sitemap)
+  print(f"✅ {mode}: Generated {sitemap.count} pages into: {out.resolve()}")
+  finish_output(mode=mode)
+
+def _build_mode_job(job: tuple[Mode, str]) -> None:
+  # one mode per worker process; its pages render in-process (no nested pools)
+  os.environ["BUILD_WORKERS"] = "1"
+  mode, out = job
+  build_mode(mode, Path(out))
+
+def build_all(out: Path) -> None:
+  modes = all_modes()
+
+  # a single-mode build owns the whole output dir; clear it before nesting
+  root_manifest = manifest_path(out)
+  if root_manifest.exists():
+    reset_output_dir(out)
+    root_manifest.unlink()
+  elif out.is_dir():
+    # the root only holds {mode}/ dirs; anything else is left over (e.g. a checkout)
+    for entry in out.iterdir():
+      if entry.name in BUILDERS:
+        continue
+      if entry.is_dir() and not entry.is_symlink():
+        shutil.rmtree(entry)
+      else:
+        entry.unlink()
+
+  workers = min(build_workers(), len(modes))
+  if workers <= 1:
+    for mode in modes:
+      build_mode(mode, out / mode)
+    return
+
+  # modes share no output, so build them side by side, one process each
+  wait_for_resets()
+  with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as ex:
+    list(ex.map(_build_mode_job, [(mode, os.fspath(out / mode)) for mode in modes]))
+
 def main() -> None:
-  here = Path(__file__).resolve().parent
-  out = here / CONFIG.output_dir
-
-  reset_output_dir(out)
-  copy_site_image(src_dir=here, out_dir=out, filename=CONFIG.image_filename)
-
-  if SITE_MODE == "regular":
-    build_regular(out=out)
-  elif SITE_MODE == "cost":
-    build_cost(out=out)
-  elif SITE_MODE == "state":
-    build_state(out=out)
-  elif SITE_MODE == "subdomain":
-    build_subdomain(out=out)
-  elif SITE_MODE == "regular_city_only":
-    build_regular_city_only(out=out)
+  out = HERE / CONFIG.output_dir
+
+  if SITE_MODE == "all":
+    build_all(out)
   else:
-    raise ValueError(f"Unknown SITE_MODE: {SITE_MODE!r}")
+    build_mode(SITE_MODE, out)
+  write_text(HERE / "wrangler.jsonc", wrangler_content())
 
 if __name__ == "__main__":
   main()
@@ -0,0 +1,161 @@
+"""
+Incremental output (the build manifest): unchanged files are skipped, and
+stale or foreign files are removed, even when their directories are already gone.
+`all` builds nest each mode under public/{mode}/ and clean up after single-mode builds.
+
+Each test builds a scratch copy of the site with generate.py in a subprocess.
+Run: python3 -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import gzip
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPO = Path(__file__).resolve().parent.parent
+SITE_FILES = ("generate.py", "cities.csv", "woodpecker-damage-epoxy-repair.jpg", "assets")
+
+
+class SiteBuildCase(unittest.TestCase):
+  def setUp(self) -> None:
+    self.tmp = Path(tempfile.mkdtemp(prefix="site-"))
+    self.addCleanup(shutil.rmtree, self.tmp, True)
+    for name in SITE_FILES:
+      src = REPO / name
+      if src.is_dir():
+        shutil.copytree(src, self.tmp / name)
+      else:
+        shutil.copy2(src, self.tmp / name)
+    self.out = self.tmp / "public"
+
+  def run_generate(self, mode: str, *args: str, **env_overrides: str) -> subprocess.CompletedProcess:
+    skip = ("SITE_ORIGIN", "SUBDOMAIN_BASE", "COPY_VARIANT", "SITE_MODES", "CSS_INLINE", "PRECOMPRESS")
+    env = {k: v for k, v in os.environ.items() if k not in skip}
+    env["BUILD_WORKERS"] = "1"
+    env.update(env_overrides)
+    return subprocess.run(
+      [sys.executable, "generate.py", mode, *args],
+      cwd=self.tmp, env=env, capture_output=True, text=True,
+    )
+
+  def build(self, mode: str, *args: str, **env_overrides: str) -> str:
+    proc = self.run_generate(mode, *args, **env_overrides)
+    self.assertEqual(proc.returncode, 0, proc.stderr)
+    return proc.stdout
+
+  def snapshot(self, root: Path) -> dict[str, bytes]:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+  def drop_city(self, line_prefix: str) -> None:
+    csv_path = self.tmp / "cities.csv"
+    lines = csv_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    kept = [l for l in lines if not l.startswith(line_prefix)]
+    self.assertEqual(len(kept), len(lines) - 1)
+    csv_path.write_text("".join(kept), encoding="utf-8")
+
+
+class IncrementalBuildTest(SiteBuildCase):
+  def test_unchanged_files_are_skipped(self) -> None:
+    self.build("regular")
+    page = self.out / "abilene-tx" / "index.html"
+    before = page.stat().st_mtime_ns
+    stdout = self.build("regular")
+    self.assertIn("unchanged files left as-is", stdout)
+    self.assertEqual(page.stat().st_mtime_ns, before)
+
+  def test_stale_pages_are_deleted(self) -> None:
+    self.build("regular")
+    self.drop_city("Abilene,")
+    self.build("regular")
+    self.assertFalse((self.out / "abilene-tx").exists())
+    self.assertTrue((self.out / "ada-ok" / "index.html").exists())
+
+  def test_stale_page_with_missing_parent(self) -> None:
+    self.build("cost")
+    self.drop_city("Abilene,")
+    shutil.rmtree(self.out / "abilene-tx")
+    self.build("cost")
+    self.assertFalse((self.out / "cost" / "abilene-tx").exists())
+    # the manifest was written, so the next run is incremental again
+    self.assertIn("unchanged files left as-is", self.build("cost"))
+
+  def test_files_changed_on_disk_are_rewritten(self) -> None:
+    self.build("state")
+    index = self.out / "index.html"
+    expected = index.read_bytes()
+    index.write_bytes(b"<!doctype html>stale checkout\n")
+    foreign = self.out / "abilene-tx" / "index.html"
+    foreign.parent.mkdir()
+    foreign.write_bytes(b"regular-mode leftover\n")
+
+    self.build("state")
+    self.assertEqual(index.read_bytes(), expected)
+    self.assertFalse(foreign.parent.exists())
+
+  def test_force_rewrites_everything(self) -> None:
+    self.build("regular")
+    page = self.out / "abilene-tx" / "index.html"
+    before = page.stat().st_mtime_ns
+    stdout = self.build("regular", "--force")
+    self.assertNotIn("unchanged files left as-is", stdout)
+    self.assertNotEqual(page.stat().st_mtime_ns, before)
+    # --force only skips reading the manifest; the next run is incremental again
+    self.assertIn("unchanged files left as-is", self.build("regular"))
+
+  def test_precompressed_copies_are_pruned(self) -> None:
+    self.build("state", PRECOMPRESS="1")
+    page = self.out / "index.html"
+    self.assertEqual(gzip.decompress((self.out / "index.html.gz").read_bytes()), page.read_bytes())
+    self.assertEqual((self.out / ".assetsignore").read_text(encoding="utf-8"), "*.gz\n")
+
+    self.build("state")
+    self.assertEqual(list(self.out.rglob("*.gz")), [])
+    self.assertFalse((self.out / ".assetsignore").exists())
+
+
+class AllModesTest(SiteBuildCase):
+  def test_invalid_site_modes_leaves_output_untouched(self) -> None:
+    self.build("regular")
+    before = self.snapshot(self.out)
+    proc = self.run_generate("all", SITE_MODES="regular,bogus")
+    self.assertNotEqual(proc.returncode, 0)
+    self.assertIn("Invalid SITE_MODES entry 'bogus'", proc.stderr)
+    self.assertEqual(self.snapshot(self.out), before)
+
+  def test_mode_dir_matches_single_mode_build(self) -> None:
+    self.build("cost")
+    single = self.snapshot(self.out)
+    self.build("all", SITE_MODES="cost")
+    self.assertEqual(sorted(p.name for p in self.out.iterdir()), ["cost"])
+    self.assertEqual(self.snapshot(self.out / "cost"), single)
+
+  def test_switching_between_single_mode_and_all(self) -> None:
+    self.build("regular")
+    single = self.snapshot(self.out)
+
+    # single -> all: the root's single-mode files and manifest go away
+    self.build("all", SITE_MODES="regular,state")
+    self.assertEqual(sorted(p.name for p in self.out.iterdir()), ["regular", "state"])
+    self.assertFalse((self.tmp / ".build-cache" / "public.json").exists())
+
+    # all -> single: the {mode}/ dirs are pruned as untracked output
+    self.build("regular")
+    self.assertEqual(self.snapshot(self.out), single)
+
+  def test_unmanaged_root_is_cleared_for_all(self) -> None:
+    # e.g. a checkout of a single-mode build, with no manifest behind it
+    (self.out / "abilene-tx").mkdir(parents=True)
+    (self.out / "abilene-tx" / "index.html").write_bytes(b"checked-in page\n")
+    (self.out / "sitemap.xml").write_bytes(b"<urlset />\n")
+    self.build("all", SITE_MODES="state")
+    self.assertEqual(sorted(p.name for p in self.out.iterdir()), ["state"])
+
+
+if __name__ == "__main__":
+  unittest.main()